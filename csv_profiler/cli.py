@@ -1,6 +1,7 @@
 """CLI interface for CSV data profiler."""
 
 import click
+import os
 import sys
 from pathlib import Path
 
@@ -93,25 +94,29 @@ def profile(filepath: str, output: str, format: str, chunk_size: int, schema: st
         
         # Format and output report
         formatter = ReportFormatter(summary)
-        report = formatter.format(format)
         
         if output:
-            # Write to file
+            # Write to file, streaming the report through a large write buffer.
+            # The report goes to a temporary file next to the target and is moved
+            # into place only once complete, so a failure never leaves a partial report.
             output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
             
-            if format == 'html':
-                output_path.write_text(report, encoding='utf-8')
-            else:
-                output_path.write_text(report, encoding='utf-8')
+            out = open(tmp_path, 'x', encoding='utf-8', buffering=128 * 1024)
+            try:
+                with out:
+                    formatter.format(format, out=out)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
             
             click.echo(f"✅ Report saved to: {output_path.absolute()}", err=False)
         else:
             # Print to console
-            if format == 'table':
-                click.echo(report, err=False)
-            else:
-                click.echo(report, err=False)
+            report = formatter.format(format)
+            click.echo(report, err=False)
     
     except FileNotFoundError as e:
         click.echo(f"❌ Error: {e}", err=True)
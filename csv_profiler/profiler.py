@@ -1,17 +1,475 @@
 """Core data profiling module for CSV files."""
 
 import os
+import sys
 import csv
 from typing import Dict, List, Any, Tuple, Optional
-import statistics
 from collections import Counter, defaultdict
+from itertools import islice, repeat
+from functools import lru_cache
 from dataclasses import dataclass
 import json
 import re
 import math
+import hashlib
+import heapq
 
+import numpy as np
 
-@dataclass
+# Optional: when pyarrow is installed, CSV tokenizing and per-column counting
+# run in Arrow's C++ reader instead of the Python row loop.
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# PII heuristics, compiled once instead of on every sample check
+_RE_SSN_DASH = re.compile(r"\d{3}-\d{2}-\d{4}")
+_RE_EMAIL = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_RE_PHONE = re.compile(r"\d{3}[-\.\s]?\d{3}[-\.\s]?\d{4}")
+
+# Non-null values kept per column for the PII value heuristics
+_PII_SAMPLE_SIZE = 20
+
+
+def _looks_like_ssn(s: str) -> bool:
+    # U.S. SSN patterns: 123-45-6789 or 9 digits
+    if not s:
+        return False
+    s = s.strip()
+    if len(s) == 9:
+        return s.isdecimal()
+    return len(s) == 11 and _RE_SSN_DASH.fullmatch(s) is not None
+
+
+def _looks_like_npi(s: str) -> bool:
+    # NPI is 10-digit numeric identifier
+    if not s:
+        return False
+    s = s.strip()
+    return len(s) == 10 and s.isdecimal()
+
+
+def _looks_like_email(s: str) -> bool:
+    if not s:
+        return False
+    return _RE_EMAIL.search(s) is not None
+
+
+def _looks_like_phone(s: str) -> bool:
+    if not s:
+        return False
+    # simple phone detection
+    return _RE_PHONE.search(s) is not None
+
+
+_PII_VALUE_CHECKS = (
+    ("ssn", _looks_like_ssn),
+    ("npi", _looks_like_npi),
+    ("email", _looks_like_email),
+    ("phone", _looks_like_phone),
+)
+
+
+def _sample_pii_kinds(samples: List[str]) -> set:
+    """Return the PII kinds matched by any sampled value, in one pass over the samples.
+
+    Each value is stripped once, and a kind stops being checked as soon as one
+    value matches it.
+    """
+    found = set()
+    pending = _PII_VALUE_CHECKS
+    for value in samples:
+        value = value.strip()
+        for kind, check in pending:
+            if check(value):
+                found.add(kind)
+        if found:
+            pending = tuple(item for item in pending if item[0] not in found)
+            if not pending:
+                break
+    return found
+
+
+# Non-null cell types, tallied per column in fixed slots
+_TYPE_NAMES = ("int", "float", "bool", "string")
+_TYPE_SLOTS = {name: slot for slot, name in enumerate(_TYPE_NAMES)}
+
+_ASCII_DIGITS = frozenset("0123456789")
+_BOOL_STRINGS = frozenset(("true", "false", "yes", "no", "1", "0"))
+
+
+def _classify(s: str) -> str:
+    """Classify a stripped, non-empty cell as int, float, bool or string.
+
+    Plain ASCII numbers are recognised by scanning characters, so ordinary text
+    never pays for a raised ValueError. Only inputs the scan can't settle
+    (underscores, non-ASCII digits, inf/nan spellings) go through int()/float().
+    """
+    n = len(s)
+    i = 1 if n and s[0] in "+-" else 0
+    if s[i:].isdecimal():
+        return "int"
+
+    start = i
+    saw_digit = saw_dot = saw_exp = False
+    while i < n:
+        c = s[i]
+        if c in _ASCII_DIGITS:
+            saw_digit = True
+        elif c == "." and not saw_dot and not saw_exp:
+            saw_dot = True
+        elif c in "eE" and saw_digit and not saw_exp:
+            saw_exp = True
+            saw_digit = False
+            if i + 1 < n and s[i + 1] in "+-":
+                i += 1
+        else:
+            break
+        i += 1
+
+    if i == n:
+        if saw_digit:
+            return "float"
+    elif "_" in s or not s.isascii() or s[start] in "iInN":
+        try:
+            int(s)
+            return "int"
+        except ValueError:
+            pass
+        try:
+            float(s)
+            return "float"
+        except ValueError:
+            pass
+
+    if s.lower() in _BOOL_STRINGS:
+        return "bool"
+    return "string"
+
+
+# Distinct values are read once per chunk; the cache carries low-cardinality
+# columns across chunks (and across columns sharing a vocabulary) for free.
+# It holds raw cell text, so profile() clears it when the read finishes.
+@lru_cache(maxsize=65536)
+def _read_cell(value: str) -> Tuple[str, Optional[float]]:
+    """Return a non-empty cell's type and, for int/float cells, its float value."""
+    kind = _classify(value.strip())
+    if kind == "int" or kind == "float":
+        return kind, float(value)
+    return kind, None
+
+
+# Distinct values counted exactly per column before switching to a sketch
+_EXACT_DISTINCT_LIMIT = 10_000
+
+# Counters kept for the most frequent values once a column passes that limit;
+# 10x the five values reported, so the reported ones are reliable heavy hitters
+_TOP_VALUE_SLOTS = 50
+
+
+def _advise_sequential(f) -> None:
+    """Tell the kernel ``f`` will be read front to back so it reads ahead aggressively."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+class _HyperLogLog:
+    """HyperLogLog distinct-value estimator (~1.6% standard error at p=12)."""
+
+    __slots__ = ("p", "m", "registers")
+
+    def __init__(self, p: int = 12):
+        self.p = p
+        self.m = 1 << p
+        self.registers = bytearray(self.m)
+
+    def add(self, value: str) -> None:
+        # blake2b rather than hash() so estimates are stable across runs
+        h = int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+        idx = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def cardinality(self) -> int:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # small-range correction (linear counting)
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class _SpaceSaving:
+    """Space-Saving heavy-hitter sketch over k counters.
+
+    Any value occurring in more than 1/k of the stream is guaranteed a slot.
+    A newcomer evicts the smallest counter and inherits its count as error,
+    so ``count - error`` is a lower bound on the true frequency; that is
+    what gets reported.
+    """
+
+    __slots__ = ("k", "counts", "errors", "heap")
+
+    def __init__(self, k: int):
+        self.k = k
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        # One (count, value) entry per slot; increments don't touch the heap,
+        # so an entry's count may lag and is refreshed when it surfaces.
+        self.heap: List[Tuple[int, str]] = []
+
+    def __contains__(self, value: str) -> bool:
+        return value in self.counts
+
+    def add(self, value: str, count: int = 1) -> None:
+        counts = self.counts
+        if value in counts:
+            counts[value] += count
+        elif len(counts) < self.k:
+            counts[value] = count
+            self.errors[value] = 0
+            heapq.heappush(self.heap, (count, value))
+        else:
+            heap = self.heap
+            while counts[heap[0][1]] != heap[0][0]:
+                stale = heap[0][1]
+                heapq.heapreplace(heap, (counts[stale], stale))
+            floor, victim = heap[0]
+            del counts[victim], self.errors[victim]
+            counts[value] = floor + count
+            self.errors[value] = floor
+            heapq.heapreplace(heap, (floor + count, value))
+
+    def most_common(self, n: int) -> List[Tuple[str, int]]:
+        errors = self.errors
+        guaranteed = [(value, count - errors[value]) for value, count in self.counts.items()]
+        return sorted(guaranteed, key=lambda item: item[1], reverse=True)[:n]
+
+
+class _ValueCounter:
+    """Per-column value frequencies.
+
+    Values are counted exactly until the column has _EXACT_DISTINCT_LIMIT
+    distinct values. After that the exact table is dropped: a HyperLogLog
+    sketch estimates the distinct count and a Space-Saving sketch keeps the
+    most frequent values, so memory stays O(_TOP_VALUE_SLOTS).
+    """
+
+    __slots__ = ("counts", "sketch", "top", "limit")
+
+    def __init__(self, limit: int = _EXACT_DISTINCT_LIMIT):
+        self.counts: Optional[Counter] = Counter()
+        self.sketch: Optional[_HyperLogLog] = None
+        self.top: Optional[_SpaceSaving] = None
+        self.limit = limit
+
+    def add(self, value: str, count: int = 1) -> None:
+        if self.sketch is None:
+            counts = self.counts
+            counts[value] += count
+            if len(counts) >= self.limit:
+                self._spill()
+        else:
+            # Everything already in the top table has been through the sketch
+            if value not in self.top:
+                self.sketch.add(value)
+            self.top.add(value, count)
+
+    def _spill(self) -> None:
+        self.sketch = _HyperLogLog()
+        for key in self.counts:
+            self.sketch.add(key)
+        self.top = _SpaceSaving(_TOP_VALUE_SLOTS)
+        for key, count in self.counts.most_common(_TOP_VALUE_SLOTS):
+            self.top.add(key, count)
+        self.counts = None
+
+    def most_common(self, n: int) -> List[Tuple[str, int]]:
+        if self.top is None:
+            return self.counts.most_common(n)
+        return self.top.most_common(n)
+
+    def distinct_count(self) -> int:
+        if self.sketch is None:
+            return len(self.counts)
+        return max(self.limit, self.sketch.cardinality())
+
+# Numeric values sampled per column for the median; exact below this count
+_MEDIAN_RESERVOIR_SIZE = 10_000
+
+
+class _NumericSummary:
+    """Streaming min/max/mean/std-dev plus a reservoir sample for the median."""
+
+    __slots__ = ("count", "min", "max", "shift", "total", "total_sq", "size", "reservoir", "rng")
+
+    def __init__(self, size: int = _MEDIAN_RESERVOIR_SIZE):
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.shift = 0.0
+        self.total = 0.0
+        self.total_sq = 0.0
+        # the reservoir grows by doubling up to size, so short columns stay small
+        self.size = size
+        self.reservoir = np.empty(0)
+        # created on first replacement; fixed seed keeps reports reproducible
+        self.rng = None
+
+    def update(self, values: np.ndarray) -> None:
+        if not values.size:
+            return
+        if not self.count:
+            # sums are taken around the first value so the variance does not cancel
+            self.shift = float(values[0])
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        shifted = values - self.shift
+        self.total += float(shifted.sum())
+        self.total_sq += float(np.dot(shifted, shifted))
+
+        # Vitter's algorithm R, vectorised over the block
+        size = self.size
+        fill = max(0, min(size - self.count, len(values)))
+        if fill:
+            needed = self.count + fill
+            if needed > len(self.reservoir):
+                grown = np.empty(min(size, max(needed, 2 * len(self.reservoir))))
+                grown[:self.count] = self.reservoir[:self.count]
+                self.reservoir = grown
+            self.reservoir[self.count:needed] = values[:fill]
+        rest = values[fill:]
+        if rest.size:
+            if self.rng is None:
+                self.rng = np.random.default_rng(0)
+            seen = self.count + fill + np.arange(rest.size)
+            slots = self.rng.integers(0, seen + 1)
+            keep = slots < size
+            self.reservoir[slots[keep]] = rest[keep]
+        self.count += len(values)
+
+    def mean(self) -> float:
+        return self.shift + self.total / self.count
+
+    def median(self) -> float:
+        return float(np.median(self.reservoir[:min(self.count, self.size)]))
+
+    def std_dev(self) -> float:
+        if self.count < 2:
+            return 0.0
+        var = (self.total_sq - self.total * self.total / self.count) / (self.count - 1)
+        return math.sqrt(max(var, 0.0))
+
+
+class _PairwiseMoments:
+    """Streaming sums for pairwise-complete Pearson correlation between columns.
+
+    Each update takes row-aligned blocks of column values (NaN where a cell is
+    missing or not numeric). Values are shifted by each column's first-block
+    mean before summing so the final variance subtraction does not cancel.
+
+    A column gets the next matrix slot the first time it shows up with numeric
+    values, so the matrices are sized by the numeric columns alone however
+    wide the file is; ``columns`` maps each slot back to its column index.
+    """
+
+    def __init__(self):
+        self.slots: Dict[int, int] = {}
+        self.columns: List[int] = []
+        self.shift = np.zeros(0)
+        self.n = np.zeros((0, 0))
+        self.sx = np.zeros((0, 0))
+        self.sxx = np.zeros((0, 0))
+        self.sxy = np.zeros((0, 0))
+
+    def _grow(self, width: int) -> None:
+        pad = width - len(self.shift)
+        if pad <= 0:
+            return
+        self.shift = np.concatenate([self.shift, np.full(pad, np.nan)])
+        for name in ("n", "sx", "sxx", "sxy"):
+            setattr(self, name, np.pad(getattr(self, name), ((0, pad), (0, pad))))
+
+    def update(self, columns: Dict[int, np.ndarray]) -> None:
+        """Add one block; ``columns`` maps column index to that column's values."""
+        if not columns:
+            return
+        slots = self.slots
+        for column in columns:
+            if column not in slots:
+                slots[column] = len(self.columns)
+                self.columns.append(column)
+        idx = np.fromiter(map(slots.__getitem__, columns), dtype=np.intp, count=len(columns))
+        self._grow(len(self.columns))
+
+        block = np.column_stack(list(columns.values()))
+        present = np.isfinite(block)
+        unset = np.isnan(self.shift[idx]) & present.any(axis=0)
+        if unset.any():
+            self.shift[idx[unset]] = [block[present[:, k], k].mean() for k in np.flatnonzero(unset)]
+
+        x = np.where(present, block - self.shift[idx], 0.0)
+        m = present.astype(np.float64)
+        sub = np.ix_(idx, idx)
+        self.n[sub] += m.T @ m
+        self.sx[sub] += x.T @ m     # [a, b]: sum of a over rows where a and b are present
+        self.sxx[sub] += (x * x).T @ m
+        self.sxy[sub] += x.T @ x
+
+    def counts(self) -> np.ndarray:
+        """Numeric cells seen per slot."""
+        return np.diag(self.n)
+
+    def correlations(self) -> np.ndarray:
+        """Pearson r for every pair of slots; NaN where undefined."""
+        n = self.n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = self.sxy - self.sx * self.sx.T / n
+            var = self.sxx - self.sx * self.sx / n
+            corr = cov / np.sqrt(var * var.T)
+        # treat rounding-level variance as a constant column
+        flat = var <= 1e-12 * self.sxx
+        corr[(n < 2) | flat | flat.T] = np.nan
+        return corr
+
+
+class _Accumulators:
+    """Everything one read of the file folds in, keyed by column header.
+
+    A reader that gives up part-way leaves its accumulators half-filled, so
+    each read attempt gets a fresh instance.
+    """
+
+    __slots__ = ("type_counts", "pii_samples", "null_counts", "value_counts", "numeric_stats", "moments")
+
+    def __init__(self):
+        self.type_counts: Dict[str, List[int]] = defaultdict(lambda: [0] * len(_TYPE_NAMES))
+        self.pii_samples: Dict[str, List[str]] = defaultdict(list)  # first _PII_SAMPLE_SIZE non-null values
+        self.null_counts: Dict[str, int] = defaultdict(int)
+        self.value_counts: Dict[str, _ValueCounter] = defaultdict(_ValueCounter)
+        self.numeric_stats: Dict[str, _NumericSummary] = defaultdict(_NumericSummary)
+        self.moments = _PairwiseMoments()
+
+
+def _r4(x: Optional[float]) -> Optional[float]:
+    return None if x is None else round(x, 4)
+
+
+# Slotted instances are smaller and faster to read; dataclass(slots=...) needs 3.10
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ColumnProfile:
     """Data structure for a column's profile."""
     name: str
@@ -41,12 +499,81 @@ class ColumnProfile:
             "most_frequent": self.most_frequent,
             "min_value": self.min_value,
             "max_value": self.max_value,
-            "mean": round(self.mean, 4) if self.mean is not None else None,
-            "median": round(self.median, 4) if self.median is not None else None,
-            "std_dev": round(self.std_dev, 4) if self.std_dev is not None else None,
+            "mean": _r4(self.mean),
+            "median": _r4(self.median),
+            "std_dev": _r4(self.std_dev),
         }
 
 
+def _finalize_column(header, types, null_count, counter, stats, samples, total_rows) -> Tuple[ColumnProfile, List[str]]:
+    """Build one column's profile and PII flags from its streamed accumulators."""
+
+    # Determine primary data type
+    non_null_types = [t for t, n in zip(_TYPE_NAMES, types) if n > 0]
+    if not non_null_types:
+        primary_type = "null"
+    elif types[_TYPE_SLOTS["int"]] + types[_TYPE_SLOTS["float"]] == sum(types):
+        primary_type = "numeric"
+    elif len(non_null_types) > 1:
+        primary_type = "mixed"
+    else:
+        primary_type = non_null_types[0]
+
+    # Get most frequent values
+    most_frequent = counter.most_common(5)
+
+    # Numeric statistics were accumulated while streaming the file
+    if primary_type not in ("int", "float", "numeric"):
+        stats = None
+
+    min_val = None
+    max_val = None
+    mean_val = None
+    median_val = None
+    std_dev_val = None
+
+    if stats is not None and stats.count:
+        min_val = stats.min
+        max_val = stats.max
+        mean_val = stats.mean()
+        median_val = stats.median()
+        std_dev_val = stats.std_dev()
+
+    # Count duplicate rows from the distinct count (estimated for very high-cardinality columns)
+    distinct_values = min(counter.distinct_count(), total_rows - null_count)
+    duplicate_rows = total_rows - distinct_values if distinct_values else 0
+
+    null_pct = (null_count / total_rows * 100) if total_rows > 0 else 0
+
+    profile = ColumnProfile(
+        name=header,
+        data_type=primary_type,
+        total_rows=total_rows,
+        null_count=null_count,
+        null_percentage=null_pct,
+        duplicate_rows=duplicate_rows,
+        distinct_values=distinct_values,
+        most_frequent=most_frequent,
+        min_value=min_val,
+        max_value=max_val,
+        mean=mean_val,
+        median=median_val,
+        std_dev=std_dev_val,
+    )
+
+    # PII detection heuristics (based on header name and sample values)
+    flags = []
+    lname = header.lower()
+    if 'name' in lname or 'full_name' in lname or 'first' in lname or 'last' in lname:
+        flags.append('possible_name')
+    sampled = _sample_pii_kinds(samples)
+    for kind, _ in _PII_VALUE_CHECKS:
+        if kind in lname or kind in sampled:
+            flags.append(kind)
+
+    return profile, flags
+
+
 class DataProfiler:
     """Main profiler class for analyzing CSV files."""
     
@@ -71,52 +598,8 @@ class DataProfiler:
         if value is None or value == "":
             return "null"
         
-        value_stripped = str(value).strip()
-        
-        # Try integer
-        try:
-            int(value_stripped)
-            return "int"
-        except ValueError:
-            pass
-        
-        # Try float
-        try:
-            float(value_stripped)
-            return "float"
-        except ValueError:
-            pass
-        
-        # Try boolean
-        if value_stripped.lower() in ("true", "false", "yes", "no", "1", "0"):
-            return "bool"
-        
-        return "string"
-
-    def _looks_like_ssn(self, s: str) -> bool:
-        # U.S. SSN patterns: 123-45-6789 or 9 digits
-        if not s:
-            return False
-        s = s.strip()
-        return bool(re.fullmatch(r"\d{3}-\d{2}-\d{4}", s) or re.fullmatch(r"\d{9}", s))
-
-    def _looks_like_npi(self, s: str) -> bool:
-        # NPI is 10-digit numeric identifier
-        if not s:
-            return False
-        return bool(re.fullmatch(r"\d{10}", s.strip()))
-
-    def _looks_like_email(self, s: str) -> bool:
-        if not s:
-            return False
-        return bool(re.search(r"[^@\s]+@[^@\s]+\.[^@\s]+", s))
-
-    def _looks_like_phone(self, s: str) -> bool:
-        if not s:
-            return False
-        # simple phone detection
-        return bool(re.search(r"\d{3}[-\.\s]?\d{3}[-\.\s]?\d{4}", s))
-    
+        return _classify(str(value).strip())
+
     def _is_numeric(self, inferred_type: str) -> bool:
         """Check if a type is numeric."""
         return inferred_type in ("int", "float")
@@ -138,53 +621,234 @@ class DataProfiler:
                 return None
         
         return None
-    
+
+    def _accumulate_rows(self, chunk, acc: _Accumulators) -> None:
+        """Fold a block of buffered rows (one list of cell strings per header) into the accumulators."""
+        numeric = {}
+        for i, (header, values) in enumerate(zip(self.headers, chunk)):
+            numbers = self._accumulate_column_chunk(header, values, acc)
+            if numbers is not None:
+                numeric[i] = numbers
+        acc.moments.update(numeric)
+
+    def _accumulate_column_chunk(self, header, values, acc: _Accumulators) -> Optional[np.ndarray]:
+        """Fold a chunk of raw cell strings for one column into the accumulators.
+
+        Returns the chunk's numeric values aligned to rows (NaN where a cell is
+        not numeric), or None when the chunk has no numeric cells.
+        """
+        counts = Counter(values)
+        acc.null_counts[header] += counts.pop("", 0) + counts.pop(None, 0)
+        if not counts:
+            return None
+
+        parsed: Dict[str, float] = {}
+        for value, count in counts.items():
+            acc.value_counts[header].add(value, count)
+            inferred_type, number = _read_cell(value)
+            acc.type_counts[header][_TYPE_SLOTS[inferred_type]] += count
+            if number is not None:
+                parsed[value] = number
+
+        samples = acc.pii_samples[header]
+        if len(samples) < _PII_SAMPLE_SIZE:
+            samples.extend(islice((v for v in values if v), _PII_SAMPLE_SIZE - len(samples)))
+        if not parsed:
+            return None
+        numbers = np.fromiter(map(parsed.get, values, repeat(np.nan)), dtype=np.float64, count=len(values))
+        acc.numeric_stats[header].update(numbers[~np.isnan(numbers)])
+        return numbers
+
+    def _accumulate_arrow_batch(self, batch, acc: _Accumulators) -> None:
+        """Fold one Arrow record batch into the accumulators."""
+        numeric = {}
+        for i, (header, column) in enumerate(zip(self.headers, batch.columns)):
+            numbers = self._accumulate_arrow_column(header, column, acc)
+            if numbers is not None:
+                numeric[i] = numbers
+        acc.moments.update(numeric)
+
+    def _accumulate_arrow_column(self, header, column, acc: _Accumulators) -> Optional[np.ndarray]:
+        """Fold one Arrow column chunk into the per-column accumulators.
+
+        Returns the numeric values aligned to rows, like _accumulate_column_chunk.
+        """
+        if pa.types.is_dictionary(column.type):
+            column = column.dictionary_decode()
+        full = column
+
+        nulls = pc.is_null(column, nan_is_null=True)
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            nulls = pc.or_kleene(nulls, pc.equal(column, ""))
+        null_count = pc.sum(nulls).as_py() or 0
+        acc.null_counts[header] += null_count
+        if null_count == len(column):
+            return None
+        if null_count:
+            column = column.filter(pc.invert(nulls))
+
+        counts = pc.value_counts(column)
+        distinct = counts.field('values')
+        tallies = counts.field('counts').to_pylist()
+        keys = [str(v) for v in distinct.to_pylist()]
+
+        samples = acc.pii_samples[header]
+        if len(samples) < _PII_SAMPLE_SIZE:
+            samples.extend(str(v) for v in column.slice(0, _PII_SAMPLE_SIZE - len(samples)).to_pylist())
+
+        if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+            # Typed numeric column: every cell shares one type, values come straight from the buffer
+            for value, count in zip(keys, tallies):
+                acc.value_counts[header].add(value, count)
+            acc.type_counts[header][_TYPE_SLOTS["int" if pa.types.is_integer(column.type) else "float"]] += len(column)
+            numbers = np.asarray(full.to_numpy(zero_copy_only=False), dtype=np.float64)
+            acc.numeric_stats[header].update(numbers[~np.isnan(numbers)])
+            return numbers
+
+        # Infer types once per distinct value rather than once per cell
+        parsed = []
+        for value, count in zip(keys, tallies):
+            acc.value_counts[header].add(value, count)
+            inferred_type, number = _read_cell(value)
+            acc.type_counts[header][_TYPE_SLOTS[inferred_type]] += count
+            parsed.append(number)
+
+        if all(v is None for v in parsed):
+            return None
+        positions = pc.index_in(full, value_set=distinct)
+        numbers = pc.take(pa.array(parsed, type=pa.float64()), positions).to_numpy(zero_copy_only=False)
+        acc.numeric_stats[header].update(numbers[~np.isnan(numbers)])
+        return numbers
+
+    def _read_csv_arrow(self, acc: _Accumulators) -> Optional[int]:
+        """Stream the CSV through Arrow's reader, filling the column accumulators.
+
+        Returns the row count, or None when Arrow rejects the file (e.g. ragged
+        rows) and the caller should fall back to the stdlib reader.
+        """
+        # Read every column as text so values and types match the stdlib path;
+        # Arrow's own inference would rewrite numbers (75000.50 -> 75000.5).
+        row_count = 0
+        try:
+            with open(self.filepath, 'rb') as source:
+                _advise_sequential(source)
+                reader = pacsv.open_csv(
+                    source,
+                    read_options=pacsv.ReadOptions(block_size=8 << 20),
+                    parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={header: pa.string() for header in self.headers},
+                        null_values=[""],
+                        strings_can_be_null=True,
+                    ),
+                )
+
+                for batch in reader:
+                    row_count += batch.num_rows
+                    self._accumulate_arrow_batch(batch, acc)
+        except pa.ArrowInvalid:
+            return None
+
+        return row_count
+
+    def _read_csv_pandas(self, acc: _Accumulators) -> Optional[int]:
+        """Stream the CSV through pandas' C parser in chunk_size blocks.
+
+        Returns the row count, or None when pandas is not installed or rejects
+        the file (e.g. rows with extra fields) and the caller should fall back
+        to the stdlib reader.
+        """
+        # optional dependency
+        try:
+            import pandas as _pd
+        except ImportError:
+            return None
+
+        width = len(self.headers)
+
+        # Cells stay text and empty cells stay "" (na_filter=False), matching
+        # the stdlib reader; short rows are padded with "" the same way.
+        row_count = 0
+        try:
+            frames = _pd.read_csv(
+                self.filepath,
+                engine='c',
+                encoding='utf-8',
+                dtype=str,
+                na_filter=False,
+                index_col=False,
+                chunksize=self.chunk_size,
+            )
+            for frame in frames:
+                if frame.shape[1] != width:
+                    raise _pd.errors.ParserError("column count differs from header")
+                row_count += len(frame)
+                if len(frame):
+                    chunk = frame.to_numpy(dtype=object).T.tolist()
+                    self._accumulate_rows(chunk, acc)
+        except _pd.errors.ParserError:
+            return None
+
+        return row_count
+
+    def _read_csv_stdlib(self, acc: _Accumulators) -> int:
+        """Stream the CSV through csv.reader in chunk_size blocks of rows."""
+        width = len(self.headers)
+        with open(self.filepath, 'r', encoding='utf-8', buffering=1 << 20, newline='') as f:
+            _advise_sequential(f)
+            reader = csv.reader(f)
+            next(reader, None)  # header, already read by profile()
+
+            # Buffer chunk_size rows, then transpose them into one sequence per
+            # column so each distinct value is classified once instead of every cell
+            rows_iter = filter(None, reader)  # skip blank lines
+            row_count = 0
+            while True:
+                rows = list(islice(rows_iter, self.chunk_size))
+                if not rows:
+                    break
+                row_count += len(rows)
+
+                if min(map(len, rows)) < width:
+                    for j, row in enumerate(rows):
+                        if len(row) < width:
+                            rows[j] = row + [""] * (width - len(row))
+
+                chunk = list(islice(zip(*rows), width))
+                self._accumulate_rows(chunk, acc)
+
+        return row_count
+
     def profile(self) -> Dict[str, ColumnProfile]:
         """Generate a profile of the CSV file."""
-        col_types: Dict[str, List[str]] = defaultdict(list)
-        col_values: Dict[str, List[str]] = defaultdict(list)
-        null_counts: Dict[str, int] = defaultdict(int)
-        value_counts: Dict[str, Counter] = defaultdict(Counter)
-        numeric_samples: Dict[str, List[float]] = defaultdict(list)
+        acc = _Accumulators()
         
         try:
             ext = os.path.splitext(self.filepath)[1].lower()
             # Support CSV, JSON, newline-delimited JSON, and Parquet (optional)
             if ext == '.csv':
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-
-                    if reader.fieldnames is None:
-                        self.headers = []
-                        return {}
+                with open(self.filepath, 'r', encoding='utf-8', newline='') as f:
+                    headers = next(csv.reader(f), None)
 
-                    self.headers = list(reader.fieldnames)
+                if headers is None:
+                    self.headers = []
+                    return {}
 
-                    for header in self.headers:
-                        col_types[header] = []
-                        col_values[header] = []
+                self.headers = headers
 
-                    row_count = 0
-                    for row in reader:
-                        row_count += 1
+                # Try the fast readers in turn; each attempt starts from fresh
+                # accumulators, since one that gives up part-way leaves them half-filled
+                row_count = None
+                if pa is not None:
+                    row_count = self._read_csv_arrow(acc)
+                if row_count is None:
+                    acc = _Accumulators()
+                    row_count = self._read_csv_pandas(acc)
+                if row_count is None:
+                    acc = _Accumulators()
+                    row_count = self._read_csv_stdlib(acc)
 
-                        for header in self.headers:
-                            value = row.get(header, "")
-
-                            if value is None or value == "":
-                                null_counts[header] += 1
-                                col_types[header].append("null")
-                            else:
-                                inferred_type = self._infer_type(value)
-                                col_types[header].append(inferred_type)
-                                col_values[header].append(value)
-                                value_counts[header][value] += 1
-                                if self._is_numeric(inferred_type):
-                                    parsed = self._parse_value(value, "float")
-                                    if parsed is not None:
-                                        numeric_samples[header].append(parsed)
-
-                    self.total_rows = row_count
+                self.total_rows = row_count
 
             elif ext == '.json':
                 # support either a JSON array of objects or newline-delimited JSON
@@ -203,64 +867,33 @@ class DataProfiler:
                         return {}
 
                     self.headers = list(data[0].keys())
-                    for header in self.headers:
-                        col_types[header] = []
-                        col_values[header] = []
 
-                    row_count = 0
-                    for row in data:
-                        row_count += 1
+                    # Gather each column of a block of records in one pass
+                    for start in range(0, len(data), self.chunk_size):
+                        rows = data[start:start + self.chunk_size]
+                        chunk = []
                         for header in self.headers:
-                            value = row.get(header, "")
-                            if value is None or value == "":
-                                null_counts[header] += 1
-                                col_types[header].append("null")
-                            else:
-                                inferred_type = self._infer_type(str(value))
-                                col_types[header].append(inferred_type)
-                                col_values[header].append(str(value))
-                                value_counts[header][str(value)] += 1
-                                if self._is_numeric(inferred_type):
-                                    parsed = self._parse_value(str(value), "float")
-                                    if parsed is not None:
-                                        numeric_samples[header].append(parsed)
-
-                    self.total_rows = row_count
+                            column = [row.get(header) for row in rows]
+                            chunk.append(["" if value is None else str(value) for value in column])
+                        self._accumulate_rows(chunk, acc)
+
+                    self.total_rows = len(data)
 
             elif ext in ('.parquet', '.pq'):
                 # optional dependency
-                try:
-                    import pandas as _pd
-                except Exception:
-                    raise RuntimeError("Reading Parquet requires 'pandas' and optional 'pyarrow'. Please install them to proceed.")
-
-                df = _pd.read_parquet(self.filepath)
-                if df.empty:
-                    self.headers = list(df.columns)
-                    return {}
+                if pa is None:
+                    raise RuntimeError("Reading Parquet requires 'pyarrow'. Please install it to proceed.")
+                import pyarrow.parquet as pq
 
-                self.headers = list(df.columns)
-                for header in self.headers:
-                    col_types[header] = []
-                    col_values[header] = []
+                pf = pq.ParquetFile(self.filepath)
+                self.headers = list(pf.schema_arrow.names)
+                if pf.metadata.num_rows == 0:
+                    return {}
 
                 row_count = 0
-                for _, row in df.iterrows():
-                    row_count += 1
-                    for header in self.headers:
-                        value = row.get(header, "")
-                        if value is None or (isinstance(value, float) and math.isnan(value)) or value == "":
-                            null_counts[header] += 1
-                            col_types[header].append("null")
-                        else:
-                            inferred_type = self._infer_type(str(value))
-                            col_types[header].append(inferred_type)
-                            col_values[header].append(str(value))
-                            value_counts[header][str(value)] += 1
-                            if self._is_numeric(inferred_type):
-                                parsed = self._parse_value(str(value), "float")
-                                if parsed is not None:
-                                    numeric_samples[header].append(parsed)
+                for batch in pf.iter_batches(batch_size=self.chunk_size):
+                    row_count += batch.num_rows
+                    self._accumulate_arrow_batch(batch, acc)
 
                 self.total_rows = row_count
             else:
@@ -268,125 +901,40 @@ class DataProfiler:
 
         except Exception as e:
             raise RuntimeError(f"Error reading file: {str(e)}")
+        finally:
+            _read_cell.cache_clear()
         
         if self.total_rows == 0:
             return self._create_empty_profiles()
         
-        # Calculate statistics
+        # Calculate statistics; the accumulators were folded during the read,
+        # so this is a small amount of work per column
         self.profiles = {}
-        
         for header in self.headers:
-            types = col_types[header]
-            values = col_values[header]
-            null_count = null_counts[header]
-            
-            # Determine primary data type
-            non_null_types = [t for t in types if t != "null"]
-            if not non_null_types:
-                primary_type = "null"
-            else:
-                type_counts = Counter(non_null_types)
-                numeric_types = [t for t in non_null_types if t in ("int", "float")]
-                if len(numeric_types) == len(non_null_types) and numeric_types:
-                    primary_type = "numeric"
-                elif len(type_counts) > 1:
-                    primary_type = "mixed"
-                else:
-                    primary_type = type_counts.most_common(1)[0][0]
-            
-            # Get most frequent values
-            most_frequent = value_counts[header].most_common(5)
-            
-            # Calculate numeric statistics
-            numeric_values = []
-            if self._is_numeric(primary_type) or primary_type == "numeric":
-                for value in values:
-                    parsed = self._parse_value(value, "float")
-                    if parsed is not None:
-                        numeric_values.append(parsed)
-            
-            min_val = None
-            max_val = None
-            mean_val = None
-            median_val = None
-            std_dev_val = None
-            
-            if numeric_values:
-                min_val = min(numeric_values)
-                max_val = max(numeric_values)
-                mean_val = statistics.mean(numeric_values)
-                median_val = statistics.median(numeric_values)
-                
-                if len(numeric_values) > 1:
-                    std_dev_val = statistics.stdev(numeric_values)
-                else:
-                    std_dev_val = 0.0
-            
-            # Count duplicate rows
-            duplicate_rows = self.total_rows - len(set(values)) if values else 0
-            
-            null_pct = (null_count / self.total_rows * 100) if self.total_rows > 0 else 0
-            
-            profile = ColumnProfile(
-                name=header,
-                data_type=primary_type,
-                total_rows=self.total_rows,
-                null_count=null_count,
-                null_percentage=null_pct,
-                duplicate_rows=duplicate_rows,
-                distinct_values=len(value_counts[header]),
-                most_frequent=most_frequent,
-                min_value=min_val,
-                max_value=max_val,
-                mean=mean_val,
-                median=median_val,
-                std_dev=std_dev_val,
+            profile, flags = _finalize_column(
+                header, acc.type_counts[header], acc.null_counts[header], acc.value_counts[header],
+                acc.numeric_stats.get(header), acc.pii_samples[header], self.total_rows,
             )
-            
-            self.profiles[header] = profile
-
-            # PII detection heuristics (based on header name and sample values)
-            flags = []
-            lname = header.lower()
-            if 'name' in lname or 'full_name' in lname or 'first' in lname or 'last' in lname:
-                flags.append('possible_name')
-            if 'ssn' in lname or any(self._looks_like_ssn(v) for v in col_values[header][:20]):
-                flags.append('ssn')
-            if 'npi' in lname or any(self._looks_like_npi(v) for v in col_values[header][:20]):
-                flags.append('npi')
-            if 'email' in lname or any(self._looks_like_email(v) for v in col_values[header][:20]):
-                flags.append('email')
-            if 'phone' in lname or any(self._looks_like_phone(v) for v in col_values[header][:20]):
-                flags.append('phone')
-
+            self.profiles[profile.name] = profile
             if flags:
-                self.pii_flags[header] = flags
-
-        # Compute correlation matrix for numeric columns
-        numeric_cols = [h for h in self.headers if h in numeric_samples and len(numeric_samples[h]) > 1]
-        for i, a in enumerate(numeric_cols):
-            for j, b in enumerate(numeric_cols):
-                if j <= i:
-                    # symmetric
-                    continue
-                xa = numeric_samples[a]
-                xb = numeric_samples[b]
-                # align lengths by taking min length samples if they differ
-                n = min(len(xa), len(xb))
-                if n < 2:
-                    corr = None
-                else:
-                    xa_s = xa[:n]
-                    xb_s = xb[:n]
-                    mean_x = statistics.mean(xa_s)
-                    mean_y = statistics.mean(xb_s)
-                    cov = sum((u - mean_x) * (v - mean_y) for u, v in zip(xa_s, xb_s)) / (n - 1)
-                    stdev_x = statistics.stdev(xa_s)
-                    stdev_y = statistics.stdev(xb_s)
-                    corr = cov / (stdev_x * stdev_y) if stdev_x > 0 and stdev_y > 0 else None
-
-                self.correlation_matrix[(a, b)] = corr
-                self.correlation_matrix[(b, a)] = corr
+                self.pii_flags[profile.name] = flags
+
+        # Compute correlation matrix for numeric columns from the streamed sums,
+        # reading every pair out of the matrix in one go. Slots are put back in
+        # column order and only (a, b) with a before b is stored; the matrix is
+        # symmetric.
+        moments = acc.moments
+        columns = np.asarray(moments.columns, dtype=np.intp)
+        numeric_slots = np.flatnonzero(moments.counts() > 1)
+        numeric_slots = numeric_slots[np.argsort(columns[numeric_slots], kind="stable")]
+        numeric_cols = columns[numeric_slots]
+        upper_i, upper_j = np.triu_indices(len(numeric_slots), k=1)
+        corr = moments.correlations()[np.ix_(numeric_slots, numeric_slots)]
+        pairs = zip(numeric_cols[upper_i].tolist(), numeric_cols[upper_j].tolist(), corr[upper_i, upper_j].tolist())
+        for i, j, value in pairs:
+            a, b = self.headers[i], self.headers[j]
+            value = None if value != value else value  # NaN -> None
+            self.correlation_matrix[(a, b)] = value
         
         return self.profiles
     
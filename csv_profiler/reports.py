@@ -1,512 +1,460 @@
 """Report formatting for profiler output."""
 
 import json
-from typing import Dict, Any, List
+import numbers
+import os
+from html import escape
+from io import StringIO
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
 from datetime import datetime
 
+# Optional: when orjson is installed, JSON reports are serialized in native
+# code; the stdlib encoder's indent=2 path runs in pure Python.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class ReportFormatter:
-    """Format profiling results in different output formats."""
-    
-    def __init__(self, summary: Dict[str, Any]):
-        """Initialize formatter with profiling summary."""
-        self.summary = summary
-        self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    def format(self, output_format: str) -> str:
-        """
-        Format the summary in the requested format.
-        
-        Args:
-            output_format: 'table', 'html', or 'json'
-        
-        Returns:
-            Formatted report as string
-        """
-        if output_format == 'table':
-            return self._format_table()
-        elif output_format == 'html':
-            return self._format_html()
-        elif output_format == 'json':
-            return self._format_json()
-        else:
-            raise ValueError(f"Unknown format: {output_format}")
-    
-    def _format_table(self) -> str:
-        """Format as human-readable table for console."""
-        lines = []
-        
-        # Header
-        lines.append("=" * 100)
-        lines.append("CSV DATA PROFILE REPORT")
-        lines.append("=" * 100)
-        lines.append(f"\nFile: {self.summary['file']}")
-        lines.append(f"Generated: {self.timestamp}")
-        lines.append(f"Total Rows: {self.summary['total_rows']}")
-        lines.append(f"Total Columns: {self.summary['total_columns']}\n")
-        
-        # Column details
-        for col in self.summary['columns']:
-            lines.append("-" * 100)
-            lines.append(f"Column: {col['name']} | Type: {col['data_type']}")
-            lines.append("-" * 100)
-            
-            # Basic metrics
-            lines.append(f"  Total Rows:        {col['total_rows']}")
-            lines.append(f"  Null Count:        {col['null_count']} ({col['null_percentage']}%)")
-            lines.append(f"  Distinct Values:   {col['distinct_values']}")
-            lines.append(f"  Duplicate Rows:    {col['duplicate_rows']}")
-            
-            # Numeric metrics
-            if col['mean'] is not None:
-                lines.append(f"\n  Numeric Statistics:")
-                lines.append(f"    Min:             {col['min_value']}")
-                lines.append(f"    Max:             {col['max_value']}")
-                lines.append(f"    Mean:            {col['mean']}")
-                lines.append(f"    Median:          {col['median']}")
-                lines.append(f"    Std Dev:         {col['std_dev']}")
-            
-            # Most frequent values
-            if col['most_frequent']:
-                lines.append(f"\n  Most Frequent Values:")
-                for idx, (value, count) in enumerate(col['most_frequent'], 1):
-                    percentage = (count / col['total_rows'] * 100) if col['total_rows'] > 0 else 0
-                    lines.append(f"    {idx}. {value!r:<40} (count: {count}, {percentage:.2f}%)")
-            
-            lines.append("")
-        # PII flags
-        if self.summary.get('pii_flags'):
-            lines.append("PII Flags:")
-            for colname, flags in self.summary['pii_flags'].items():
-                lines.append(f" - {colname}: {', '.join(flags)}")
 
-        # Correlation matrix (small)
-        if self.summary.get('correlation_matrix'):
-            lines.append("\nCorrelation matrix (numeric columns):")
-            # build a small table
-            keys = sorted({k.split('__')[0] for k in self.summary['correlation_matrix'].keys()})
-            if keys:
-                header = [''] + keys
-                lines.append(' | '.join(header))
-                for r in keys:
-                    row = [r]
-                    for c in keys:
-                        val = self.summary['correlation_matrix'].get(f"{r}__{c}")
-                        row.append(str(val) if val is not None else 'NA')
-                    lines.append(' | '.join(row))
+def _split_pair_key(key: str, order: Dict[str, int]) -> Tuple[str, str]:
+    """Split an "a__b" correlation key back into its two column names.
 
-        lines.append("=" * 100)
-        
-        return "\n".join(lines)
-    
-    def _format_html(self) -> str:
-        """Format as standalone HTML report."""
-        html_parts = []
-        
-        # HTML Header
-        html_parts.append("""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Data Profile Report</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-            overflow: hidden;
-        }
-        
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px 30px;
-            text-align: center;
-        }
-        
-        .header h1 {
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }
-        
-        .metadata {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            padding: 30px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        
-        .metadata-item {
-            text-align: center;
-        }
-        
-        .metadata-label {
-            color: #666;
-            font-size: 0.9em;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-bottom: 5px;
-        }
-        
-        .metadata-value {
-            font-size: 1.8em;
-            font-weight: bold;
-            color: #333;
-        }
-        
-        .columns-section {
-            padding: 30px;
-        }
-        
-        .column-card {
-            background: white;
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            overflow: hidden;
-        }
-        
-        .column-header {
-            background: #f8f9fa;
-            padding: 15px 20px;
-            border-bottom: 2px solid #667eea;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .column-name {
-            font-size: 1.2em;
-            font-weight: bold;
-            color: #333;
-        }
-        
-        .column-type {
-            background: #667eea;
-            color: white;
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 0.85em;
-            font-weight: bold;
-        }
-        
-        .column-content {
-            padding: 20px;
-        }
-        
-        .metrics-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-bottom: 20px;
-        }
-        
-        .metric {
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 6px;
-            border-left: 4px solid #667eea;
-        }
-        
-        .metric-label {
-            color: #666;
-            font-size: 0.85em;
-            margin-bottom: 5px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .metric-value {
-            font-size: 1.4em;
-            font-weight: bold;
-            color: #333;
-        }
-        
-        .numeric-section {
-            margin-top: 20px;
-            padding-top: 20px;
-            border-top: 1px solid #e0e0e0;
-        }
-        
-        .numeric-title {
-            font-weight: bold;
-            color: #333;
-            margin-bottom: 10px;
-            font-size: 1.1em;
-        }
-        
-        .numeric-metrics {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 10px;
-        }
-        
-        .numeric-metric {
-            background: #e3f2fd;
-            padding: 10px;
-            border-radius: 4px;
-            border-left: 3px solid #2196F3;
-        }
-        
-        .numeric-metric-label {
-            color: #1565c0;
-            font-size: 0.8em;
-            text-transform: uppercase;
-            margin-bottom: 3px;
-        }
-        
-        .numeric-metric-value {
-            font-weight: bold;
-            color: #0d47a1;
-        }
-        
-        .frequent-section {
-            margin-top: 20px;
-            padding-top: 20px;
-            border-top: 1px solid #e0e0e0;
-        }
-        
-        .frequent-title {
-            font-weight: bold;
-            color: #333;
-            margin-bottom: 10px;
-            font-size: 1.1em;
-        }
-        
-        .frequent-list {
-            list-style: none;
-        }
-        
-        .frequent-item {
-            display: flex;
-            justify-content: space-between;
-            padding: 10px 0;
-            border-bottom: 1px solid #f0f0f0;
-            background: #fafafa;
-            padding: 10px;
-            margin-bottom: 5px;
-            border-radius: 4px;
-        }
-        
-        .frequent-value {
-            font-family: 'Courier New', monospace;
-            flex: 1;
-            word-break: break-all;
-        }
-        
-        .frequent-stats {
-            margin-left: 10px;
-            text-align: right;
-            white-space: nowrap;
-        }
-        
-        .frequent-count {
-            color: #666;
-            font-size: 0.9em;
-        }
-        
-        .frequent-percent {
-            color: #999;
-            font-size: 0.8em;
-        }
-        
-        .footer {
-            padding: 20px 30px;
-            background: #f8f9fa;
-            text-align: center;
-            color: #999;
-            font-size: 0.9em;
-        }
-        
-        .no-data {
-            color: #999;
-            font-style: italic;
-            padding: 10px;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📊 Data Profile Report</h1>
-        </div>""")
-        
-        # Metadata section
-        html_parts.append(f"""
+    Column names may contain "__" themselves, so every split point is tried
+    and one where both halves are known columns wins, preferring a before b
+    in column order (the order the profiler stores pairs in).
+    """
+    fallback = None
+    start = key.find('__')
+    while start != -1:
+        a, b = key[:start], key[start + 2:]
+        if a in order and b in order:
+            if order[a] < order[b]:
+                return a, b
+            fallback = fallback or (a, b)
+        start = key.find('__', start + 1)
+    if fallback is None:
+        a, b = key.split('__', 1)
+        return a, b
+    return fallback
+
+
+def _correlation_pairs(matrix: Dict[str, Optional[float]], column_names: List[str]) -> Tuple[List[str], Dict[Tuple[str, str], Optional[float]]]:
+    """Expand the summary's upper-triangle "a__b" entries into sorted column
+    names and a lookup that answers both (a, b) and (b, a)."""
+    order = {name: i for i, name in enumerate(column_names)}
+    pairs = {}
+    for key, value in matrix.items():
+        a, b = _split_pair_key(key, order)
+        pairs[(a, b)] = value
+        pairs[(b, a)] = value
+    return sorted({a for a, _ in pairs}), pairs
+
+
+# Column statistics that may arrive as numpy or Decimal scalars
+_FLOAT_FIELDS = ('mean', 'median', 'std_dev', 'min_value', 'max_value')
+
+
+def _normalize_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of ``summary`` whose column statistics are plain Python
+    floats/ints, so the JSON encoders never fall back to per-value callbacks.
+    Only numeric values (including NumPy scalars) are converted; anything else,
+    such as a date string, is kept as is. The caller's dicts are left untouched."""
+    columns = []
+    for col in summary.get('columns', ()):
+        col = dict(col)
+        for field in _FLOAT_FIELDS:
+            value = col.get(field)
+            if isinstance(value, numbers.Number):
+                col[field] = float(value)
+        if col.get('most_frequent'):
+            col['most_frequent'] = [
+                (value, int(count) if isinstance(count, numbers.Number) else count)
+                for value, count in col['most_frequent']
+            ]
+        columns.append(col)
+    normalized = dict(summary)
+    normalized['columns'] = columns
+    return normalized
+
+
+# Console table fragments; each ends with its own newline so they are written back to back
+_TABLE_HEADER_FMT = (
+    "=" * 100 + "\n"
+    "CSV DATA PROFILE REPORT\n"
+    + "=" * 100 + "\n"
+    "\n"
+    "File: {file}\n"
+    "Generated: {timestamp}\n"
+    "Total Rows: {total_rows}\n"
+    "Total Columns: {total_columns}\n"
+    "\n"
+)
+
+_TABLE_COL_FMT = (
+    "-" * 100 + "\n"
+    "Column: {name} | Type: {data_type}\n"
+    + "-" * 100 + "\n"
+    "  Total Rows:        {total_rows}\n"
+    "  Null Count:        {null_count} ({null_percentage}%)\n"
+    "  Distinct Values:   {distinct_values}\n"
+    "  Duplicate Rows:    {duplicate_rows}\n"
+)
+
+_TABLE_NUMERIC_FMT = (
+    "\n"
+    "  Numeric Statistics:\n"
+    "    Min:             {min_value}\n"
+    "    Max:             {max_value}\n"
+    "    Mean:            {mean}\n"
+    "    Median:          {median}\n"
+    "    Std Dev:         {std_dev}\n"
+)
+
+# %-style: the frequent-value lines are the innermost loop, and % skips the
+# per-field __format__ dispatch that str.format goes through
+_TABLE_FREQ_LINE_FMT = "    %d. %-40r (count: %s, %.2f%%)\n"
+
+# Static document head: doctype, inline stylesheet and page banner. Kept as a
+# package data file so the stylesheet is edited as HTML, and read once at import.
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'report_head.html'), encoding='utf-8') as _f:
+    _HTML_HEAD = _f.read()
+
+_METADATA_HTML_FMT = """
         <div class="metadata">
             <div class="metadata-item">
                 <div class="metadata-label">File</div>
-                <div class="metadata-value">{self.summary['file'].split('/')[-1]}</div>
+                <div class="metadata-value">{filename}</div>
             </div>
             <div class="metadata-item">
                 <div class="metadata-label">Total Rows</div>
-                <div class="metadata-value">{self.summary['total_rows']:,}</div>
+                <div class="metadata-value">{total_rows:,}</div>
             </div>
             <div class="metadata-item">
                 <div class="metadata-label">Total Columns</div>
-                <div class="metadata-value">{self.summary['total_columns']}</div>
+                <div class="metadata-value">{total_columns}</div>
             </div>
             <div class="metadata-item">
                 <div class="metadata-label">Generated</div>
-                <div class="metadata-value">{self.timestamp}</div>
+                <div class="metadata-value">{timestamp}</div>
             </div>
-        </div>""")
-        
-        # Columns section
-        html_parts.append("\n        <div class=\"columns-section\">")
-        
-        for col in self.summary['columns']:
-            html_parts.append(f"""
+        </div>"""
+
+_HTML_FOOTER_FMT = """
+        <div class="footer">
+            Generated by CSV Data Profiler on {timestamp}
+        </div>
+    </div>
+</body>
+</html>"""
+
+# Per-column HTML fragments, built once at import and filled in with format_map
+# (the frequent-value item, like its table counterpart, uses % formatting)
+_COLUMN_HTML = """
             <div class="column-card">
                 <div class="column-header">
-                    <span class="column-name">{col['name']}</span>
-                    <span class="column-type">{col['data_type']}</span>
+                    <span class="column-name">{name}</span>
+                    <span class="column-type">{data_type}</span>
                 </div>
                 <div class="column-content">
                     <div class="metrics-grid">
                         <div class="metric">
                             <div class="metric-label">Total Rows</div>
-                            <div class="metric-value">{col['total_rows']:,}</div>
+                            <div class="metric-value">{total_rows:,}</div>
                         </div>
                         <div class="metric">
                             <div class="metric-label">Null Count</div>
-                            <div class="metric-value">{col['null_count']} ({col['null_percentage']}%)</div>
+                            <div class="metric-value">{null_count} ({null_percentage}%)</div>
                         </div>
                         <div class="metric">
                             <div class="metric-label">Distinct Values</div>
-                            <div class="metric-value">{col['distinct_values']:,}</div>
+                            <div class="metric-value">{distinct_values:,}</div>
                         </div>
                         <div class="metric">
                             <div class="metric-label">Duplicate Rows</div>
-                            <div class="metric-value">{col['duplicate_rows']:,}</div>
+                            <div class="metric-value">{duplicate_rows:,}</div>
                         </div>
-                    </div>""")
-            
-            # Numeric statistics
-            if col['mean'] is not None:
-                html_parts.append(f"""
+                    </div>"""
+
+_NUMERIC_HTML = """
                     <div class="numeric-section">
                         <div class="numeric-title">Numeric Statistics</div>
                         <div class="numeric-metrics">
                             <div class="numeric-metric">
                                 <div class="numeric-metric-label">Min</div>
-                                <div class="numeric-metric-value">{col['min_value']}</div>
+                                <div class="numeric-metric-value">{min_value}</div>
                             </div>
                             <div class="numeric-metric">
                                 <div class="numeric-metric-label">Max</div>
-                                <div class="numeric-metric-value">{col['max_value']}</div>
+                                <div class="numeric-metric-value">{max_value}</div>
                             </div>
                             <div class="numeric-metric">
                                 <div class="numeric-metric-label">Mean</div>
-                                <div class="numeric-metric-value">{col['mean']}</div>
+                                <div class="numeric-metric-value">{mean}</div>
                             </div>
                             <div class="numeric-metric">
                                 <div class="numeric-metric-label">Median</div>
-                                <div class="numeric-metric-value">{col['median']}</div>
+                                <div class="numeric-metric-value">{median}</div>
                             </div>
                             <div class="numeric-metric">
                                 <div class="numeric-metric-label">Std Dev</div>
-                                <div class="numeric-metric-value">{col['std_dev']}</div>
+                                <div class="numeric-metric-value">{std_dev}</div>
                             </div>
                         </div>
-                    </div>""")
-            
-            # Most frequent values
-            if col['most_frequent']:
-                html_parts.append("""
+                    </div>"""
+
+_FREQUENT_OPEN_HTML = """
                     <div class="frequent-section">
                         <div class="frequent-title">Most Frequent Values</div>
-                        <ul class="frequent-list">""")
-                
-                for value, count in col['most_frequent']:
-                    percentage = (count / col['total_rows'] * 100) if col['total_rows'] > 0 else 0
-                    html_parts.append(f"""
+                        <ul class="frequent-list">"""
+
+_FREQUENT_ITEM_HTML = """
                             <li class="frequent-item">
-                                <span class="frequent-value"><code>{value}</code></span>
+                                <span class="frequent-value"><code>%s</code></span>
                                 <span class="frequent-stats">
-                                    <div class="frequent-count">Count: {count}</div>
-                                    <div class="frequent-percent">{percentage:.2f}%</div>
+                                    <div class="frequent-count">Count: %s</div>
+                                    <div class="frequent-percent">%.2f%%</div>
                                 </span>
-                            </li>""")
-                
-                html_parts.append("""
-                        </ul>
-                    </div>""")
-            else:
-                html_parts.append('<div class="no-data">No data to display</div>')
-            
-            html_parts.append("""
-                </div>
-            </div>""")
-            # Add PII flags section
-            if self.summary.get('pii_flags'):
-                html_parts.append("""
-                <div class=\"column-card\">
-                    <div class=\"column-header\">PII Flags</div>
-                    <div class=\"column-content\">
-                        <ul>
-                """)
-                for colname, flags in self.summary['pii_flags'].items():
-                    html_parts.append(f"<li><strong>{colname}</strong>: {', '.join(flags)}</li>")
-                html_parts.append("""
+                            </li>"""
+
+_FREQUENT_CLOSE_HTML = """
                         </ul>
-                    </div>
+                    </div>"""
+
+_NO_DATA_HTML = """
+                    <div class="no-data">No data to display</div>"""
+
+_COLUMN_CLOSE_HTML = """
                 </div>
-                """)
-
-            # Add correlation matrix (if available)
-            if self.summary.get('correlation_matrix'):
-                html_parts.append("""
-                <div class=\"column-card\">
-                    <div class=\"column-header\">Correlation Matrix (numeric columns)</div>
-                    <div class=\"column-content\">
-                        <table style=\"width:100%;border-collapse:collapse\">""")
-                keys = sorted({k.split('__')[0] for k in self.summary['correlation_matrix'].keys()})
-                html_parts.append("<tr><th></th>" + ''.join(f"<th>{k}</th>" for k in keys) + "</tr>")
+            </div>"""
+
+
+def _render_column_html(col: Dict[str, Any]) -> str:
+    """Render one column's card; depends only on the column dict.
+
+    The column name and frequent values come from the CSV, so they are
+    HTML-escaped here.
+    """
+    parts = [_COLUMN_HTML.format_map(dict(col, name=escape(col['name'])))]
+    
+    # Numeric statistics
+    if col['mean'] is not None:
+        parts.append(_NUMERIC_HTML.format_map(col))
+    
+    # Most frequent values
+    most_frequent = col['most_frequent']
+    if most_frequent:
+        parts.append(_FREQUENT_OPEN_HTML)
+        
+        total_rows = col['total_rows']
+        scale = 100.0 / total_rows if total_rows > 0 else 0.0
+        for value, count in most_frequent:
+            parts.append(_FREQUENT_ITEM_HTML % (escape(str(value)), count, count * scale))
+        
+        parts.append(_FREQUENT_CLOSE_HTML)
+    else:
+        parts.append(_NO_DATA_HTML)
+    
+    parts.append(_COLUMN_CLOSE_HTML)
+    return "".join(parts)
+
+
+class ReportFormatter:
+    """Format profiling results in different output formats."""
+    
+    # Output format name -> rendering method
+    _FORMATTERS = {
+        'table': '_format_table',
+        'html': '_format_html',
+        'json': '_format_json',
+    }
+    
+    def __init__(self, summary: Dict[str, Any], cache: bool = False, timestamp: Optional[str] = None):
+        """
+        Initialize formatter with profiling summary.
+        
+        Args:
+            summary: Summary dict from DataProfiler.get_summary()
+            cache: Keep each rendered format and return it on later calls.
+                Only safe if the summary is not modified after construction.
+            timestamp: "Generated" time to print; defaults to now. Batch
+                callers can format it once and share it across reports.
+        
+        JSON is serialized from a normalized copy made on the first JSON
+        request and reused by later ones.
+        """
+        self.summary = summary
+        self._normalized_summary: Optional[Dict[str, Any]] = None
+        self._basename = os.path.basename(summary.get('file', ''))
+        self.timestamp = timestamp if timestamp is not None else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._cache: Optional[Dict[str, str]] = {} if cache else None
+    
+    def format(self, output_format: str, out: Optional[TextIO] = None) -> str:
+        """
+        Format the summary in the requested format.
+        
+        Args:
+            output_format: 'table', 'html', or 'json'
+            out: Optional text stream to write the report to instead of
+                returning it. HTML is written fragment by fragment, so the
+                whole document is never held in memory at once.
+        
+        Returns:
+            Formatted report as string, or "" when written to ``out``
+        """
+        if self._cache is not None and output_format in self._cache:
+            report = self._cache[output_format]
+        elif out is not None and self._cache is None and output_format == 'html':
+            # Nothing to keep, so stream straight to the sink
+            self._write_html(out.write)
+            return ""
+        else:
+            method_name = self._FORMATTERS.get(output_format)
+            if method_name is None:
+                raise ValueError(f"Unknown format: {output_format}")
+            report = getattr(self, method_name)()
+
+            if self._cache is not None:
+                self._cache[output_format] = report
+
+        if out is not None:
+            out.write(report)
+            return ""
+        return report
+    
+    def _format_table(self) -> str:
+        """Format as human-readable table for console."""
+        summary = self.summary
+        buf = StringIO()
+        write = buf.write
+        write(_TABLE_HEADER_FMT.format(
+            file=summary['file'],
+            timestamp=self.timestamp,
+            total_rows=summary['total_rows'],
+            total_columns=summary['total_columns'],
+        ))
+        
+        # Column details
+        for col in summary['columns']:
+            write(_TABLE_COL_FMT.format_map(col))
+            
+            # Numeric metrics
+            if col['mean'] is not None:
+                write(_TABLE_NUMERIC_FMT.format_map(col))
+            
+            # Most frequent values
+            most_frequent = col['most_frequent']
+            if most_frequent:
+                write("\n  Most Frequent Values:\n")
+                total_rows = col['total_rows']
+                scale = 100.0 / total_rows if total_rows > 0 else 0.0
+                write("".join(
+                    _TABLE_FREQ_LINE_FMT % (idx, value, count, count * scale)
+                    for idx, (value, count) in enumerate(most_frequent, 1)
+                ))
+            
+            write("\n")
+        # PII flags
+        pii_flags = summary.get('pii_flags')
+        if pii_flags:
+            write("PII Flags:\n")
+            for colname, flags in pii_flags.items():
+                write(f" - {colname}: {', '.join(flags)}\n")
+
+        # Correlation matrix (small)
+        correlation_matrix = summary.get('correlation_matrix')
+        if correlation_matrix:
+            write("\nCorrelation matrix (numeric columns):\n")
+            # build a small table
+            keys, pairs = _correlation_pairs(correlation_matrix, [col['name'] for col in summary['columns']])
+            if keys:
+                header = [''] + keys
+                write(' | '.join(header) + "\n")
                 for r in keys:
-                    row_html = f"<tr><td><strong>{r}</strong></td>"
+                    row = [r]
                     for c in keys:
-                        val = self.summary['correlation_matrix'].get(f"{r}__{c}")
-                        row_html += f"<td>{val if val is not None else 'NA'}</td>"
-                    row_html += "</tr>"
-                    html_parts.append(row_html)
-                html_parts.append("""
-                        </table>
-                    </div>
+                        val = pairs.get((r, c))
+                        row.append(str(val) if val is not None else 'NA')
+                    write(' | '.join(row) + "\n")
+
+        write("=" * 100)
+        
+        return buf.getvalue()
+    
+    def _format_html(self) -> str:
+        """Format as standalone HTML report."""
+        buf = StringIO()
+        self._write_html(buf.write)
+        return buf.getvalue()
+    
+    def _write_html(self, write: Callable[[str], Any]) -> None:
+        """Emit the HTML report fragment by fragment through ``write``."""
+        summary = self.summary
+        
+        # HTML Header
+        write(_HTML_HEAD)
+        
+        # Metadata section
+        write(_METADATA_HTML_FMT.format(
+            filename=escape(self._basename),
+            total_rows=summary['total_rows'],
+            total_columns=summary['total_columns'],
+            timestamp=self.timestamp,
+        ))
+        
+        # Columns section
+        write("\n        <div class=\"columns-section\">")
+        
+        for col in summary['columns']:
+            write(_render_column_html(col))
+
+        # Add PII flags section
+        pii_flags = summary.get('pii_flags')
+        if pii_flags:
+            write("""
+            <div class=\"column-card\">
+                <div class=\"column-header\">PII Flags</div>
+                <div class=\"column-content\">
+                    <ul>""")
+            for colname, flags in pii_flags.items():
+                write(f"\n                        <li><strong>{escape(colname)}</strong>: {escape(', '.join(flags))}</li>")
+            write("""
+                    </ul>
+                </div>
+            </div>""")
+
+        # Add correlation matrix (if available)
+        correlation_matrix = summary.get('correlation_matrix')
+        if correlation_matrix:
+            write("""
+            <div class=\"column-card\">
+                <div class=\"column-header\">Correlation Matrix (numeric columns)</div>
+                <div class=\"column-content\">
+                    <table style=\"width:100%;border-collapse:collapse\">""")
+            keys, pairs = _correlation_pairs(correlation_matrix, [col['name'] for col in summary['columns']])
+            # column names come from the CSV header; escape each once
+            labels = {k: escape(k) for k in keys}
+            write("\n<tr><th></th>" + ''.join(f"<th>{labels[k]}</th>" for k in keys) + "</tr>")
+            for r in keys:
+                row_html = f"\n<tr><td><strong>{labels[r]}</strong></td>"
+                for c in keys:
+                    val = pairs.get((r, c))
+                    row_html += f"<td>{val if val is not None else 'NA'}</td>"
+                row_html += "</tr>"
+                write(row_html)
+            write("""
+                    </table>
                 </div>
-                """)
-        html_parts.append("""
+            </div>""")
+        write("""
         </div>""")
         
         # Footer
-        html_parts.append(f"""
-        <div class="footer">
-            Generated by CSV Data Profiler on {self.timestamp}
-        </div>
-    </div>
-</body>
-</html>""")
-        
-        return "\n".join(html_parts)
+        write(_HTML_FOOTER_FMT.format(timestamp=self.timestamp))
     
     def _format_json(self) -> str:
         """Format as JSON."""
-        return json.dumps(self.summary, indent=2)
+        if self._normalized_summary is None:
+            self._normalized_summary = _normalize_summary(self.summary)
+        if orjson is not None:
+            return orjson.dumps(self._normalized_summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+        return json.dumps(self._normalized_summary, indent=2)
@@ -6,16 +6,27 @@ import tempfile
 import csv
 from pathlib import Path
 import sys
+import tracemalloc
+from unittest import mock
+
+import numpy as np
 
 # Add parent directory to path to import profiler
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from profiler import DataProfiler, ColumnProfile
+from profiler import DataProfiler, ColumnProfile, _NumericSummary, _read_cell
 
 
 class TestDataProfiler(unittest.TestCase):
     """Test cases for DataProfiler class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share one profiler for the stateless type-inference helpers."""
+        cls._static_profiler = DataProfiler(
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_data.csv')
+        )
+    
     def setUp(self):
         """Set up test fixtures."""
         self.test_dir = os.path.dirname(os.path.abspath(__file__))
@@ -153,6 +164,133 @@ class TestDataProfiler(unittest.TestCase):
             # Min should be <= Max
             self.assertLessEqual(age_profile.min_value, age_profile.max_value)
     
+    def test_profile_ragged_rows(self):
+        """Test that rows with missing or extra fields are still counted."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('a,b,c\n1,2\n3,4,5,6\n,x,\n')
+            temp_file = f.name
+        
+        try:
+            profiler = DataProfiler(temp_file)
+            profiles = profiler.profile()
+            self.assertEqual(profiles['a'].total_rows, 3)
+            self.assertEqual(profiles['c'].null_count, 2)
+        finally:
+            os.unlink(temp_file)
+    
+    def test_profile_pandas_reader_matches_stdlib(self):
+        """Test that the pandas reader produces the same profile as csv.reader."""
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            self.skipTest("pandas is not installed")
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('a,b,c\n1,x\n2,y,3.5\n\n3\n,z,\n4,,7\n 5,w,00.5\n')
+            temp_file = f.name
+        
+        try:
+            with mock.patch('profiler.pa', None):
+                with mock.patch.object(DataProfiler, '_read_csv_stdlib', side_effect=AssertionError("fell back to csv.reader")):
+                    via_pandas = DataProfiler(temp_file)
+                    via_pandas.profile()
+                with mock.patch.object(DataProfiler, '_read_csv_pandas', return_value=None):
+                    via_stdlib = DataProfiler(temp_file)
+                    via_stdlib.profile()
+            
+            self.assertEqual(via_pandas.total_rows, 6)
+            self.assertEqual(via_pandas.get_summary(), via_stdlib.get_summary())
+        finally:
+            os.unlink(temp_file)
+    
+    def test_profile_high_cardinality_estimate(self):
+        """Test that distinct counts past the exact limit are estimated closely."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('id\n')
+            f.write(''.join(f'{i}\n' for i in range(25000)))
+            temp_file = f.name
+        
+        try:
+            profiler = DataProfiler(temp_file)
+            id_profile = profiler.profile()['id']
+            self.assertAlmostEqual(id_profile.distinct_values, 25000, delta=25000 * 0.05)
+            self.assertEqual(id_profile.duplicate_rows, 25000 - id_profile.distinct_values)
+        finally:
+            os.unlink(temp_file)
+    
+    def test_profile_high_cardinality_top_values(self):
+        """Test that a value dominating after the exact limit still ranks first."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('code\n')
+            f.write(''.join(f'c{i}\n' for i in range(12000)))
+            f.write('hot\n' * 8000)
+            temp_file = f.name
+        
+        try:
+            profiler = DataProfiler(temp_file)
+            top_value, top_count = profiler.profile()['code'].most_frequent[0]
+            self.assertEqual(top_value, 'hot')
+            self.assertGreaterEqual(top_count, 8000)
+        finally:
+            os.unlink(temp_file)
+    
+    def test_profile_clears_cell_cache(self):
+        """Test that cell text cached during a run is not kept afterwards."""
+        DataProfiler(self.sample_data_path).profile()
+        self.assertEqual(_read_cell.cache_info().currsize, 0)
+    
+    def test_numeric_summary_reservoir_grows_to_cap(self):
+        """Test that the median reservoir is sized by the data, up to its cap."""
+        summary = _NumericSummary(size=100)
+        summary.update(np.arange(3, dtype=np.float64))
+        self.assertLess(len(summary.reservoir), 100)
+        self.assertEqual(summary.median(), 1.0)
+        
+        summary.update(np.arange(500, dtype=np.float64))
+        self.assertEqual(len(summary.reservoir), 100)
+        self.assertEqual(summary.count, 503)
+    
+    def test_profile_correlation_row_aligned(self):
+        """Test that correlation pairs values from the same row, skipping nulls."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('x,y,flat\n1,2,5\n,100,5\n2,4,5\n3,6,5\n4,,5\n5,10,5\n')
+            temp_file = f.name
+        
+        try:
+            profiler = DataProfiler(temp_file)
+            profiler.profile()
+            self.assertAlmostEqual(profiler.correlation_matrix[('x', 'y')], 1.0, places=9)
+            self.assertIsNone(profiler.correlation_matrix[('x', 'flat')])
+            self.assertNotIn(('y', 'x'), profiler.correlation_matrix)
+        finally:
+            os.unlink(temp_file)
+    
+    def test_profile_correlation_wide_file(self):
+        """Test that correlation memory follows the numeric columns, not the file width."""
+        width = 2000
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(','.join(f'c{i}' for i in range(width)) + '\n')
+            for i in range(5):
+                row = ['x'] * width
+                row[0], row[-1] = str(i), str(2 * i)
+                f.write(','.join(row) + '\n')
+            temp_file = f.name
+        
+        try:
+            profiler = DataProfiler(temp_file)
+            tracemalloc.start()
+            try:
+                profiler.profile()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            self.assertEqual(list(profiler.correlation_matrix), [('c0', f'c{width - 1}')])
+            self.assertAlmostEqual(profiler.correlation_matrix[('c0', f'c{width - 1}')], 1.0, places=9)
+            # width x width moment matrices alone would be 4 * 32 MB
+            self.assertLess(peak, 64 * 1024 * 1024)
+        finally:
+            os.unlink(temp_file)
+    
     def test_profile_get_summary(self):
         """Test that get_summary returns expected structure."""
         profiler = DataProfiler(self.sample_data_path)
@@ -195,28 +333,28 @@ class TestDataProfiler(unittest.TestCase):
     
     def test_infer_type_int(self):
         """Test type inference for integers."""
-        profiler = DataProfiler(self.sample_data_path)
+        profiler = self._static_profiler
         self.assertEqual(profiler._infer_type('123'), 'int')
     
     def test_infer_type_float(self):
         """Test type inference for floats."""
-        profiler = DataProfiler(self.sample_data_path)
+        profiler = self._static_profiler
         self.assertEqual(profiler._infer_type('123.45'), 'float')
     
     def test_infer_type_string(self):
         """Test type inference for strings."""
-        profiler = DataProfiler(self.sample_data_path)
+        profiler = self._static_profiler
         self.assertEqual(profiler._infer_type('hello'), 'string')
     
     def test_infer_type_null(self):
         """Test type inference for null values."""
-        profiler = DataProfiler(self.sample_data_path)
+        profiler = self._static_profiler
         self.assertEqual(profiler._infer_type(''), 'null')
         self.assertEqual(profiler._infer_type(None), 'null')
     
     def test_is_numeric(self):
         """Test numeric type detection."""
-        profiler = DataProfiler(self.sample_data_path)
+        profiler = self._static_profiler
         self.assertTrue(profiler._is_numeric('int'))
         self.assertTrue(profiler._is_numeric('float'))
         self.assertFalse(profiler._is_numeric('string'))
@@ -226,25 +364,24 @@ class TestDataProfiler(unittest.TestCase):
 class TestLargeFile(unittest.TestCase):
     """Test handling of larger files."""
     
-    def setUp(self):
-        """Create a larger test CSV file."""
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-        self.temp_file_path = self.temp_file.name
-        
-        # Write header
-        self.temp_file.write('id,value,category\n')
+    @classmethod
+    def setUpClass(cls):
+        """Create a larger test CSV file shared by every test in the class."""
+        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
+        cls.temp_file_path = temp_file.name
         
-        # Write 1000 rows
-        for i in range(1000):
-            category = 'A' if i % 2 == 0 else 'B'
-            self.temp_file.write(f'{i},{i * 10.5},{category}\n')
+        # Header plus 1000 rows, written in one call
+        rows = ['id,value,category\n']
+        rows.extend(f'{i},{i * 10.5},{"A" if i % 2 == 0 else "B"}\n' for i in range(1000))
+        temp_file.write("".join(rows))
         
-        self.temp_file.close()
+        temp_file.close()
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary file."""
-        if os.path.exists(self.temp_file_path):
-            os.unlink(self.temp_file_path)
+        if os.path.exists(cls.temp_file_path):
+            os.unlink(cls.temp_file_path)
     
     def test_large_file_profiling(self):
         """Test that profiler can handle larger files efficiently."""
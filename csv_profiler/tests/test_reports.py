@@ -0,0 +1,130 @@
+"""Unit tests for report formatting."""
+
+import unittest
+import os
+import io
+import tempfile
+import json
+import sys
+from decimal import Decimal
+
+import numpy as np
+
+# Add parent directory to path to import reports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from profiler import DataProfiler
+from reports import ReportFormatter
+
+
+class TestReportFormatter(unittest.TestCase):
+    """Test cases for ReportFormatter class."""
+    
+    def setUp(self):
+        """Profile the sample data once per test."""
+        test_dir = os.path.dirname(os.path.abspath(__file__))
+        profiler = DataProfiler(os.path.join(test_dir, 'sample_data.csv'))
+        profiler.profile()
+        self.summary = profiler.get_summary()
+    
+    def test_format_table(self):
+        """Test that the table report lists every column."""
+        report = ReportFormatter(self.summary).format('table')
+        self.assertIn("CSV DATA PROFILE REPORT", report)
+        for col in self.summary['columns']:
+            self.assertIn(f"Column: {col['name']} |", report)
+    
+    def test_format_html(self):
+        """Test that the HTML report is a complete document with one card per column."""
+        report = ReportFormatter(self.summary).format('html')
+        self.assertTrue(report.startswith("<!DOCTYPE html>"))
+        self.assertTrue(report.endswith("</html>"))
+        self.assertEqual(report.count('<span class="column-name">'), len(self.summary['columns']))
+    
+    def test_format_json(self):
+        """Test that the JSON report round-trips to the summary."""
+        report = ReportFormatter(self.summary).format('json')
+        self.assertEqual(json.loads(report)['total_rows'], self.summary['total_rows'])
+    
+    def test_format_html_escapes_csv_text(self):
+        """Test that column names and values from the CSV are HTML-escaped."""
+        col = self.summary['columns'][0]
+        col['name'] = '<b>a&b</b>'
+        col['most_frequent'] = [('<script>', 1)]
+        report = ReportFormatter(self.summary).format('html')
+        self.assertIn('&lt;b&gt;a&amp;b&lt;/b&gt;', report)
+        self.assertIn('<code>&lt;script&gt;</code>', report)
+        self.assertNotIn('<script>', report)
+    
+    def test_format_json_scalars(self):
+        """Test that numpy and Decimal statistics serialize as plain numbers."""
+        col = self.summary['columns'][0]
+        col['mean'] = Decimal('1.5')
+        col['max_value'] = np.float64(2.5)
+        col['most_frequent'] = [('a', np.int64(3))]
+        parsed = json.loads(ReportFormatter(self.summary).format('json'))['columns'][0]
+        self.assertEqual(parsed['mean'], 1.5)
+        self.assertEqual(parsed['max_value'], 2.5)
+        self.assertEqual(parsed['most_frequent'], [['a', 3]])
+        self.assertIsInstance(col['mean'], Decimal)
+    
+    def test_non_numeric_min_max(self):
+        """Test that non-numeric min/max values are reported unchanged."""
+        col = next(c for c in self.summary['columns'] if c['name'] == 'age')
+        col['min_value'] = '2020-01-01'
+        col['max_value'] = '2020-12-31'
+        formatter = ReportFormatter(self.summary)
+        self.assertIn("2020-01-01", formatter.format('table'))
+        self.assertIn("2020-12-31", formatter.format('html'))
+        parsed = json.loads(formatter.format('json'))['columns'][1]
+        self.assertEqual(parsed['name'], 'age')
+        self.assertEqual(parsed['min_value'], '2020-01-01')
+        self.assertEqual(parsed['max_value'], '2020-12-31')
+    
+    def test_correlation_labels_with_separator_in_name(self):
+        """Test that a column name containing "__" keeps its correlations."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('x__y,z\n1,2\n2,4\n3,7\n')
+            temp_file = f.name
+        
+        try:
+            profiler = DataProfiler(temp_file)
+            profiler.profile()
+            report = ReportFormatter(profiler.get_summary()).format('table')
+        finally:
+            os.unlink(temp_file)
+        
+        self.assertIn(" | x__y | z\n", report)
+        self.assertRegex(report, r"\nz \| 0\.\d+ \| NA\n")
+    
+    def test_format_unknown(self):
+        """Test that an unknown format raises ValueError."""
+        with self.assertRaises(ValueError):
+            ReportFormatter(self.summary).format('xml')
+    
+    def test_format_to_stream(self):
+        """Test that writing to a stream produces the same report as returning it."""
+        formatter = ReportFormatter(self.summary)
+        for output_format in ('table', 'html', 'json'):
+            out = io.StringIO()
+            self.assertEqual(formatter.format(output_format, out=out), "")
+            self.assertEqual(out.getvalue(), formatter.format(output_format))
+    
+    def test_timestamp_override(self):
+        """Test that a supplied timestamp is used in place of the current time."""
+        formatter = ReportFormatter(self.summary, timestamp='2024-01-01 00:00:00')
+        self.assertIn("Generated: 2024-01-01 00:00:00", formatter.format('table'))
+    
+    def test_format_cache(self):
+        """Test that a caching formatter renders each format once."""
+        formatter = ReportFormatter(self.summary, cache=True)
+        first = formatter.format('html')
+        self.summary['total_rows'] += 1
+        self.assertIs(formatter.format('html'), first)
+        
+        uncached = ReportFormatter(self.summary)
+        self.assertIsNot(uncached.format('html'), uncached.format('html'))
+
+
+if __name__ == '__main__':
+    unittest.main()